@@ -6,28 +6,47 @@ using random user data and proxy rotation to avoid detection.
 
 Features:
 - MongoDB integration for data persistence
+- Concurrent asynchronous requests (aiohttp worker pool)
 - Proxy rotation for request distribution
 - Random user data generation
-- Retry logic with exponential backoff
-- Progress tracking and resume capability
+- Token-bucket rate limiting with exponential backoff on retries
+- Results persisted to MongoDB as they are scraped, with resume capability
+- CSV export of all results at the end of each run (including interrupted runs)
 - Multiple export formats
 
 Author: [Your Name]
 License: MIT
 """
 
-import json
+import asyncio
+import collections
+import csv
 import logging
+import multiprocessing
+import os
 import random
-import string
 import time
 from typing import Dict, List, Optional
 
-import pandas as pd
-import requests
+import aiohttp
+import jmespath
+import numpy as np
+import orjson
+import zstandard as zstd
+from aiolimiter import AsyncLimiter
 from faker import Faker
 from fp.fp import FreeProxy
-from pymongo import MongoClient
+from pybloom_live import ScalableBloomFilter
+from pymongo import AsyncMongoClient, UpdateOne, WriteConcern
+from pymongo.errors import BulkWriteError
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+from bson.binary import Binary
 from bson.objectid import ObjectId
 
 
@@ -39,6 +58,79 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Request rate the site tolerates, shared by all worker processes
+REQUESTS_PER_SECOND = 2.9
+
+# Attempts per zip code and backoff for transient vs. rate-limit failures
+MAX_ATTEMPTS = 3
+TRANSIENT_WAIT = wait_exponential_jitter(initial=2, max=30)
+RATE_LIMITED_WAIT = wait_exponential_jitter(initial=15, max=120)
+
+# Seconds to wait for a worker process to flush its results on shutdown
+WORKER_SHUTDOWN_TIMEOUT = 30
+
+# Fields copied from the response "data" object into the exported CSV
+RESPONSE_FIELDS = [
+    "date", "ldate", "email", "name", "phone", "rooms", "promocode",
+    "sixteens", "twelves", "clientIP", "months", "CityFrom", "StateFrom", "ID"
+]
+CSV_FIELDS = ["zip_code", "total_price", "timestamp"] + RESPONSE_FIELDS
+
+# Compiled lookups into decoded responses and stored results
+TOTAL_PRICE_PATH = jmespath.compile("data.pricing.total")
+RESPONSE_DATA_PATH = jmespath.compile(
+    "data.{" + ", ".join(f"{field}: {field}" for field in RESPONSE_FIELDS) + "}"
+)
+
+# User agents rotated across requests
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/119.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edge/119.0.0.0 Safari/537.36"
+]
+
+# Email domains by provider type
+EMAIL_DOMAINS = {
+    "gmail": ["gmail.com", "googlemail.com"],
+    "yahoo": ["yahoo.com", "yahoo.co.uk", "ymail.com"],
+    "hotmail": ["hotmail.com", "outlook.com", "live.com"],
+    "icloud": ["icloud.com", "me.com"],
+    "proton": ["protonmail.com", "proton.me"],
+    "random": ["gmail.com", "yahoo.com", "hotmail.com", "outlook.com", "icloud.com"]
+}
+
+# US area codes used for random phone numbers
+AREA_CODES = [
+    "201", "202", "203", "205", "206", "207", "208", "209", "210", "212",
+    "213", "214", "215", "216", "217", "218", "219", "224", "225", "228",
+    # ... (truncated for brevity - include full list in actual implementation)
+    "986", "989"
+]
+
+# Number of Faker values pregenerated for each random data pool
+POOL_SIZE = 20000
+
+
+class RateLimited(Exception):
+    """Raised when the site answers 403/429 or reports that the limit was reached."""
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry rate limiting, network and server errors, but not other client errors."""
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status >= 500 or exc.status == 408
+    return isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError, RateLimited))
+
+
+def _retry_wait(retry_state) -> float:
+    """Back off longer after rate limiting than after transient errors."""
+    if isinstance(retry_state.outcome.exception(), RateLimited):
+        return RATE_LIMITED_WAIT(retry_state)
+    return TRANSIENT_WAIT(retry_state)
+
 
 class StoragePriceScraper:
     """
@@ -49,7 +141,9 @@ class StoragePriceScraper:
     """
     
     def __init__(self, mongo_uri: str = "localhost", mongo_port: int = 27017, 
-                 database: str = "test", collection: str = "zipcodes"):
+                 database: str = "test", collection: str = "zipcodes",
+                 concurrency: int = 64, requests_per_second: float = REQUESTS_PER_SECOND,
+                 write_batch_size: int = 100, use_proxies: bool = False):
         """
         Initialize the StoragePriceScraper.
         
@@ -58,26 +152,53 @@ class StoragePriceScraper:
             mongo_port: MongoDB connection port
             database: Database name
             collection: Collection name for zip codes
+            concurrency: Number of concurrent request workers
+            requests_per_second: Global request rate kept below the site's limit
+            write_batch_size: Number of buffered MongoDB updates per bulk write
+            use_proxies: Route requests through rotating free proxies
         """
         # MongoDB setup
-        self.client = MongoClient(mongo_uri, mongo_port, connect=False, maxPoolSize=5000)
+        self.client = AsyncMongoClient(mongo_uri, mongo_port, maxPoolSize=200)
         self.db = self.client[database]
         self.zipcodes_collection = self.db[collection]
+        # Unacknowledged writes for tag flips; a lost one only means a re-scrape
+        self._tag_collection = self.db.get_collection(collection, write_concern=WriteConcern(w=0))
+        
+        # Buffered MongoDB updates, flushed with bulk_write
+        self.write_batch_size = write_batch_size
+        self._pending_ops: List[UpdateOne] = []
+        self._ops_lock = asyncio.Lock()
         
-        # Session and utilities
-        self.session = requests.Session()
+        # Session and utilities (the HTTP session is opened inside the event loop)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._session_generation = 0
         self.faker = Faker()
+        # Built on first use; seeding and exporting never need them
+        self._name_pool: List[str] = []
+        self._username_pool: List[str] = []
+        self._rng = np.random.default_rng()
+        self._phone_cache: collections.deque = collections.deque()
+        self.concurrency = concurrency
+        # One request per interval; aiolimiter rejects every acquire when
+        # max_rate < 1, which a per-process share of the rate easily is
+        self._limiter = AsyncLimiter(max_rate=1, time_period=1 / requests_per_second)
         
         # Request tracking
-        self.results = []
+        self.processed_requests = 0
         self.failed_requests = 0
         self.successful_requests = 0
-        self.used_emails = set()
+        self._seen_emails = ScalableBloomFilter(initial_capacity=10000, error_rate=1e-4)
+        
+        # Raw responses are stored zstd-compressed
+        self._zctx = zstd.ZstdCompressor(level=3)
+        self._zdctx = zstd.ZstdDecompressor()
         
         # Proxy management
+        self.use_proxies = use_proxies
         self.proxies_list = []
         self.current_proxy_index = 0
         self.max_requests_before_switch = 5
+        self._sessions_by_proxy: Dict[str, aiohttp.ClientSession] = {}
         
         # Headers for requests
         self.base_headers = {
@@ -90,14 +211,80 @@ class StoragePriceScraper:
             "user-agent": self._get_random_user_agent(),
             "x-requested-with": "XMLHttpRequest"
         }
+        # One read-only header set per user agent, shared by all requests
+        self._header_variants = [{**self.base_headers, "user-agent": ua} for ua in USER_AGENTS]
+        self._post_url = "https://unitsstorage.com/san-antonio-tx/wp-admin/admin-ajax.php"
+        
+        # Form fields that are the same for every request
+        self._static_payload = {
+            "action": "submit_quote_function",
+            "data[date]": "09/29/2025",
+            "data[discount]": "n",
+            "data[distance]": "0",
+            "data[formtype]": "storage",
+            "data[homecubicft]": "830",
+            "data[homelinearft]": "12",
+            "data[ldate]": "2025-09-26",
+            "data[location]": "onsite",
+            "data[months]": "1",
+            "data[newsletter]": "false",
+            "data[q]": "quoterequest",
+            "data[sixteens]": "0",
+            "data[warehouseDistance]": "0",
+            "data[zip2]": "",
+            "data[promocode]": "",
+            "data[track]": "",
+            "track": ""
+        }
         
         # Initialize components
-        self._load_proxies()
+        if self.use_proxies:
+            self._load_proxies()
+
+    def _new_session(self) -> aiohttp.ClientSession:
+        """
+        Create an HTTP session sized for the worker pool.
+        
+        Returns:
+            New aiohttp client session
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency,
+            limit_per_host=self.concurrency,
+            ssl=False
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    def _get_proxy_session(self, proxy_url: str) -> aiohttp.ClientSession:
+        """
+        Get the HTTP session dedicated to a proxy.
+        
+        Connections are closed after every request so that no CONNECT tunnel
+        is reused between requests.
+        
+        Args:
+            proxy_url: Proxy URL
+            
+        Returns:
+            aiohttp client session for the proxy
+        """
+        session = self._sessions_by_proxy.get(proxy_url)
+        if session is None:
+            connector = aiohttp.TCPConnector(
+                limit=4,
+                force_close=True,
+                enable_cleanup_closed=True,
+                ssl=False
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions_by_proxy[proxy_url] = session
+        return session
 
     def _load_proxies(self) -> None:
         """Load free proxies from FreeProxy service."""
         try:
-            self.proxies_list = FreeProxy().get_proxy_list()
+            # FreeProxy returns bare "ip:port" entries; aiohttp needs a scheme
+            self.proxies_list = [f"http://{proxy}" for proxy in FreeProxy().get_proxy_list(repeat=False)]
             logger.info(f"Loaded {len(self.proxies_list)} proxies")
         except Exception as e:
             logger.warning(f"Failed to load proxies: {e}")
@@ -128,15 +315,12 @@ class StoragePriceScraper:
         Returns:
             Random user agent string
         """
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/119.0",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edge/119.0.0.0 Safari/537.36"
-        ]
-        return random.choice(user_agents)
+        return random.choice(USER_AGENTS)
+
+    def _build_pools(self) -> None:
+        """Pregenerate the Faker name and username pools."""
+        self._name_pool = [self.faker.name() for _ in range(POOL_SIZE)]
+        self._username_pool = [self.faker.user_name() for _ in range(POOL_SIZE)]
 
     def _generate_random_email(self, domain_type: str = "random") -> str:
         """
@@ -148,35 +332,14 @@ class StoragePriceScraper:
         Returns:
             Random email address
         """
-        domains = {
-            "gmail": ["gmail.com", "googlemail.com"],
-            "yahoo": ["yahoo.com", "yahoo.co.uk", "ymail.com"],
-            "hotmail": ["hotmail.com", "outlook.com", "live.com"],
-            "icloud": ["icloud.com", "me.com"],
-            "proton": ["protonmail.com", "proton.me"],
-            "random": ["gmail.com", "yahoo.com", "hotmail.com", "outlook.com", "icloud.com"]
-        }
-
-        domain_list = domains.get(domain_type, domains["random"])
-        domain = random.choice(domain_list)
-
-        # Multiple username generation methods
-        methods = [
-            lambda: self.faker.user_name() + str(random.randint(100, 999)),
-            lambda: self.faker.first_name().lower() + self.faker.last_name().lower() + str(random.randint(10, 99)),
-            lambda: "".join(random.choices(string.ascii_lowercase + string.digits, k=10)),
-            lambda: self.faker.word() + self.faker.word() + str(random.randint(100, 999))
-        ]
-
-        username = random.choice(methods)()
-        email = f"{username}@{domain}"
-
-        # Ensure email uniqueness
-        if email in self.used_emails:
-            return self._generate_random_email(domain_type)
+        domain_list = EMAIL_DOMAINS.get(domain_type, EMAIL_DOMAINS["random"])
 
-        self.used_emails.add(email)
-        return email
+        # Ensure email uniqueness (false positives only cost an extra draw)
+        while True:
+            email = f"{random.choice(self._username_pool)}{random.randint(100, 999)}@{random.choice(domain_list)}"
+            if email not in self._seen_emails:
+                self._seen_emails.add(email)
+                return email
 
     def _generate_random_phone(self) -> str:
         """
@@ -185,18 +348,23 @@ class StoragePriceScraper:
         Returns:
             Random phone number in format (XXX) XXX-XXXX
         """
-        area_codes = [
-            "201", "202", "203", "205", "206", "207", "208", "209", "210", "212",
-            "213", "214", "215", "216", "217", "218", "219", "224", "225", "228",
-            # ... (truncated for brevity - include full list in actual implementation)
-            "986", "989"
-        ]
-        
-        area_code = random.choice(area_codes)
-        prefix = random.randint(200, 999)
-        line_number = random.randint(1000, 9999)
+        if not self._phone_cache:
+            self._refill_phone_cache()
+        return self._phone_cache.popleft()
 
-        return f"({area_code}) {prefix}-{line_number}"
+    def _refill_phone_cache(self, n: int = 10000) -> None:
+        """
+        Pre-draw a batch of random phone numbers.
+        
+        Args:
+            n: Number of phone numbers to generate
+        """
+        area_codes = self._rng.choice(AREA_CODES, n)
+        prefixes = self._rng.integers(200, 1000, n)
+        line_numbers = self._rng.integers(1000, 10000, n)
+        self._phone_cache.extend(
+            f"({a}) {p}-{l}" for a, p, l in zip(area_codes, prefixes, line_numbers)
+        )
 
     def _generate_random_name(self) -> str:
         """
@@ -205,9 +373,9 @@ class StoragePriceScraper:
         Returns:
             Random full name
         """
-        return self.faker.name()
+        return random.choice(self._name_pool)
 
-    def _get_base_payload(self, zip_code: str) -> str:
+    def _get_base_payload(self, zip_code: str) -> Dict[str, str]:
         """
         Generate the payload with random personal data for the request.
         
@@ -215,185 +383,260 @@ class StoragePriceScraper:
             zip_code: Target zip code for the request
             
         Returns:
-            URL-encoded payload string
+            Form fields for the request (URL-encoded by aiohttp)
         """
-        base_payload = {
-            "action": "submit_quote_function",
-            "data[date]": "09/29/2025",
-            "data[discount]": "n",
-            "data[distance]": "0",
+        if not self._name_pool:
+            self._build_pools()
+
+        payload = self._static_payload.copy()
+        payload.update({
             "data[email]": self._generate_random_email(random.choice(["gmail", "yahoo", "hotmail", "random"])),
-            "data[formtype]": "storage",
-            "data[homecubicft]": "830",
-            "data[homelinearft]": "12",
-            "data[ldate]": "2025-09-26",
-            "data[location]": "onsite",
-            "data[months]": "1",
             "data[name]": self._generate_random_name(),
-            "data[newsletter]": "false",
             "data[phone]": self._generate_random_phone(),
-            "data[q]": "quoterequest",
             "data[rooms]": str(random.randint(2, 5)),
-            "data[sixteens]": "0",
             "data[twelves]": str(random.randint(1, 5)),
-            "data[warehouseDistance]": "0",
-            "data[zip1]": zip_code,
-            "data[zip2]": "",
-            "data[promocode]": "",
-            "data[track]": "",
-            "track": ""
-        }
+            "data[zip1]": zip_code
+        })
+        return payload
 
-        # URL encode the payload
-        return "&".join([f"{k}={v}" for k, v in base_payload.items()])
+    def _decode_response(self, raw: bytes) -> Optional[Dict]:
+        """
+        Decode a raw API response body.
+        
+        Args:
+            raw: Response body
+            
+        Returns:
+            Decoded JSON object or None if the body is not a JSON object
+        """
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return None
+        return data if isinstance(data, dict) else None
 
-    def _parse_response(self, response_text: str, zip_code: str) -> Dict:
+    def _parse_response(self, raw: bytes, zip_code: str) -> Dict:
         """
-        Parse the API response and extract pricing data.
+        Extract pricing data from the API response.
         
         Args:
-            response_text: Raw response text from API
+            raw: Raw response body from API
             zip_code: Zip code associated with the request
             
         Returns:
             Dictionary containing parsed data
         """
-        try:
-            data = json.loads(response_text)
-            total_price = None
-
-            if data.get("success"):
-                # Extract total price from nested structure
-                if ("data" in data and "pricing" in data["data"] and 
-                    "total" in data["data"]["pricing"]):
-                    total_price = data["data"]["pricing"]["total"]
-
-            return {
-                "zip_code": zip_code,
-                "total_price": total_price,
-                "raw_response": data,
-                "timestamp": time.time()
-            }
-
-        except json.JSONDecodeError:
+        data = self._decode_response(raw)
+        total_price = None
+
+        if data is None:
             logger.error(f"Zip {zip_code}: Failed to parse JSON response")
-            return {
-                "zip_code": zip_code,
-                "total_price": None,
-                "raw_response": response_text,
-                "timestamp": time.time()
-            }
+        elif data.get("success"):
+            # Extract total price from nested structure
+            total_price = TOTAL_PRICE_PATH.search(data)
+
+        return {
+            "zip_code": zip_code,
+            "total_price": total_price,
+            "raw_response_zstd": Binary(self._zctx.compress(raw)),
+            "timestamp": time.time()
+        }
+
+    @retry(
+        stop=stop_after_attempt(MAX_ATTEMPTS),
+        wait=_retry_wait,
+        retry=retry_if_exception(_is_retryable),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+    async def _post_once(self, payload: Dict[str, str], zip_code: str) -> bytes:
+        """
+        Send one quote request, retried according to the backoff policy.
+        
+        Args:
+            payload: Form fields for the request
+            zip_code: Target zip code
+            
+        Returns:
+            Raw response body
+            
+        Raises:
+            RateLimited: If the site rejected or rate limited the request
+            aiohttp.ClientError: On connection errors and other error statuses
+        """
+        # Prepare request parameters
+        headers = self._header_variants[random.randrange(len(self._header_variants))]
+        proxy = self._get_next_proxy() if self.use_proxies else None
+
+        logger.info(f"Making request for zip {zip_code}")
 
-    def _make_request(self, id_zip_code: str, zip_code: str, retry_count: int = 2) -> Optional[Dict]:
+        request_kwargs = {
+            "headers": headers,
+            "data": payload,
+            "timeout": aiohttp.ClientTimeout(total=30)
+        }
+
+        async with self._limiter:
+            # Looked up after the limiter wait so a refresh in the meantime is seen
+            session = self.session
+            if proxy:
+                request_kwargs["proxy"] = proxy["http"]
+                session = self._get_proxy_session(proxy["http"])
+            generation = self._session_generation
+
+            async with session.post(self._post_url, **request_kwargs) as response:
+                status = response.status
+                if status not in (403, 429):
+                    response.raise_for_status()
+                    raw = await response.read()
+
+        if status == 403:
+            # Only the first worker to see a 403 since the last refresh refreshes
+            if not proxy and generation == self._session_generation:
+                await self._refresh_session()
+            raise RateLimited(f"Zip {zip_code}: 403 Forbidden")
+        if status == 429:
+            raise RateLimited(f"Zip {zip_code}: 429 Too Many Requests")
+        if b'"limit_reached"' in raw:
+            raise RateLimited(f"Zip {zip_code}: limit reached")
+        return raw
+
+    async def _make_request(self, id_zip_code: str, zip_code: str) -> Optional[Dict]:
         """
         Make a single request with retry logic and error handling.
         
         Args:
             id_zip_code: MongoDB document ID for the zip code
             zip_code: Target zip code
-            retry_count: Number of retry attempts
             
         Returns:
             Parsed response data or None if all attempts failed
         """
-        url = "https://unitsstorage.com/san-antonio-tx/wp-admin/admin-ajax.php"
         payload = self._get_base_payload(zip_code)
 
-        for attempt in range(retry_count):
-            try:
-                # Random delay between requests
-                delay = random.uniform(3, 10)
-                logger.info(f"Waiting {delay:.1f} seconds before request...")
-                time.sleep(delay)
-
-                # Prepare request parameters
-                headers = self.base_headers.copy()
-                headers["user-agent"] = self._get_random_user_agent()
-                proxy = self._get_next_proxy()
-
-                logger.info(f"Making request for zip {zip_code} (attempt {attempt + 1})")
-
-                session_kwargs = {
-                    "headers": headers,
-                    "data": payload,
-                    "timeout": 30
-                }
-
-                # if proxy:
-                #     session_kwargs["proxies"] = proxy
-
-                response = self.session.post(url, **session_kwargs)
-
-                if response.status_code == 200 and '"limit_reached"' not in response.text:
-                    self.successful_requests += 1
-                    logger.info(f"✓ Success for zip {zip_code}")
-
-                    # Update database and process response
-                    self._update_tag(id_zip_code)
-                    parsed_response = self._parse_response(response.text, zip_code)
-                    self._update_results(id_zip_code, parsed_response)
-
-                    return parsed_response
-
-                elif response.status_code == 403:
-                    logger.warning(f"✗ Zip {zip_code}: 403 Forbidden (attempt {attempt + 1})")
-                    if attempt == 1:  # Refresh session on second attempt
-                        self._refresh_session()
-                else:
-                    logger.warning(f"✗ Zip {zip_code}: Status {response.status_code} (attempt {attempt + 1})")
+        try:
+            raw = await self._post_once(payload, zip_code)
+        except Exception as e:
+            logger.error(f"✗ Zip {zip_code}: All attempts failed - {e}")
+            self.failed_requests += 1
+            await self._update_tag(id_zip_code)
+            return None
 
-            except Exception as e:
-                logger.error(f"✗ Zip {zip_code}: Error on attempt {attempt + 1} - {e}")
+        self.successful_requests += 1
+        logger.info(f"✓ Success for zip {zip_code}")
 
-            # Exponential backoff before retry
-            if attempt < retry_count - 1:
-                retry_delay = random.uniform(15, 30)
-                logger.info(f"Waiting {retry_delay:.1f} seconds before retry...")
-                time.sleep(retry_delay)
+        # Process response and store it (also marks the zip as processed)
+        parsed_response = self._parse_response(raw, zip_code)
+        await self._update_results(id_zip_code, parsed_response)
 
-        self.failed_requests += 1
-        self._update_tag(id_zip_code)
-        return None
+        return parsed_response
 
-    def _refresh_session(self) -> None:
+    async def _refresh_session(self) -> None:
         """Refresh the session to get new cookies and avoid detection."""
         logger.info("Refreshing session...")
-        self.session.close()
-        self.session = requests.Session()
+        # The session stays open as other workers are still using it;
+        # dropping its cookies is enough to start a fresh visit
+        self._session_generation += 1
+        self.session.cookie_jar.clear()
 
         try:
-            self.session.get(
-                "https://unitsstorage.com/san-antonio-tx/storage-calculator/",
-                headers={"User-Agent": self._get_random_user_agent()},
-                timeout=10
-            )
+            # Counts against the same request budget as the quote requests
+            async with self._limiter:
+                async with self.session.get(
+                    "https://unitsstorage.com/san-antonio-tx/storage-calculator/",
+                    headers={"User-Agent": self._get_random_user_agent()},
+                    timeout=aiohttp.ClientTimeout(total=10)
+                ) as response:
+                    await response.read()
             logger.info("Session refreshed successfully")
         except Exception as e:
             logger.warning(f"Failed to refresh session: {e}")
 
-    def _get_item_from_mongo(self) -> Optional[Dict]:
+    async def _ensure_indexes(self) -> None:
+        """Create the indexes used for claiming and seeding zip codes."""
+        # Claims filter on tag and take the oldest documents first
+        await self.zipcodes_collection.create_index([("tag", 1), ("_id", 1)])
+        await self.zipcodes_collection.create_index("zip_code", unique=True)
+
+    async def _normalize_zip_codes(self) -> None:
+        """Convert numeric zip codes stored by older versions to 5-digit strings."""
+        padded = {"$concat": ["0000", {"$toString": {"$toLong": "$zip_code"}}]}
+        try:
+            result = await self.zipcodes_collection.update_many(
+                {"zip_code": {"$type": "number"}},
+                [{"$set": {"zip_code": {
+                    "$substrCP": [padded, {"$subtract": [{"$strLenCP": padded}, 5]}, 5]
+                }}}]
+            )
+            if result.modified_count:
+                logger.info(f"Converted {result.modified_count} numeric zip codes to strings")
+        except Exception as e:
+            logger.warning(f"Failed to normalize zip codes in MongoDB: {e}")
+
+    async def _claim_batch(self, n: int = 100) -> List[Dict]:
         """
-        Get the next zip code to process from MongoDB.
+        Claim a batch of unprocessed zip codes from MongoDB.
         
+        Args:
+            n: Maximum number of documents to claim
+            
         Returns:
-            MongoDB document or None if no documents found
+            List of claimed documents (empty when nothing is left)
         """
         try:
-            find_item_mongo = self.zipcodes_collection.find_one({"tag": False})
-            if find_item_mongo:
-                self.zipcodes_collection.update_one(
-                    {"_id": ObjectId(find_item_mongo["_id"])}, 
-                    {"$set": {"tag": "progress"}}
+            while True:
+                docs = await (
+                    self.zipcodes_collection.find({"tag": False}, {"_id": 1, "zip_code": 1})
+                    .sort("_id", 1)
+                    .limit(n)
+                    .to_list(n)
                 )
-                return find_item_mongo
-            else:
-                # Check for any stalled progress items
-                return self.zipcodes_collection.find_one({"tag": "progress"})
+                if not docs:
+                    return []
+
+                # Only documents still untagged are claimed; another process may
+                # have taken some of them between the find and the update
+                ids = [doc["_id"] for doc in docs]
+                claim_id = ObjectId()
+                result = await self.zipcodes_collection.update_many(
+                    {"_id": {"$in": ids}, "tag": False},
+                    {"$set": {"tag": "progress", "claim_id": claim_id}}
+                )
+                if result.modified_count == len(docs):
+                    return docs
+                if result.modified_count:
+                    return await self.zipcodes_collection.find(
+                        {"claim_id": claim_id}, {"_id": 1, "zip_code": 1}
+                    ).to_list(n)
+                # Lost the whole batch to another process; try the next one
         except Exception as e:
-            logger.error(f"Error getting item from MongoDB: {e}")
-            return None
+            logger.error(f"Error claiming batch from MongoDB: {e}")
+            return []
 
-    def _update_tag(self, input_id: str) -> None:
+    async def _queue_update(self, input_id: str, fields: Dict) -> None:
+        """
+        Buffer a MongoDB update and flush once the batch is full.
+        
+        Args:
+            input_id: MongoDB document ID
+            fields: Fields to set on the document
+        """
+        self._pending_ops.append(UpdateOne({"_id": ObjectId(input_id)}, {"$set": fields}))
+        if len(self._pending_ops) >= self.write_batch_size:
+            await self._flush_updates()
+
+    async def _flush_updates(self) -> None:
+        """Write all buffered updates to MongoDB in a single bulk operation."""
+        async with self._ops_lock:
+            if not self._pending_ops:
+                return
+            ops, self._pending_ops = self._pending_ops, []
+            try:
+                await self.zipcodes_collection.bulk_write(ops, ordered=False)
+            except Exception as e:
+                logger.error(f"Error writing {len(ops)} updates to MongoDB: {e}")
+
+    async def _update_tag(self, input_id: str) -> None:
         """
         Update the tag field in MongoDB to mark as processed.
         
@@ -401,14 +644,14 @@ class StoragePriceScraper:
             input_id: MongoDB document ID
         """
         try:
-            self.zipcodes_collection.update_one(
+            await self._tag_collection.update_one(
                 {"_id": ObjectId(input_id)}, 
                 {"$set": {"tag": True}}
             )
         except Exception as e:
             logger.error(f"Error updating tag in MongoDB: {e}")
 
-    def _update_results(self, input_id: str, results: Dict) -> None:
+    async def _update_results(self, input_id: str, results: Dict) -> None:
         """
         Update MongoDB with scraped results.
         
@@ -416,156 +659,247 @@ class StoragePriceScraper:
             input_id: MongoDB document ID
             results: Scraped data to store
         """
-        try:
-            update_data = results.copy()
-            update_data["tag"] = True
-            self.zipcodes_collection.update_one(
-                {"_id": ObjectId(input_id)}, 
-                {"$set": update_data}
-            )
-        except Exception as e:
-            logger.error(f"Error updating results in MongoDB: {e}")
+        update_data = results.copy()
+        update_data["tag"] = True
+        await self._queue_update(input_id, update_data)
 
-    def scrape_zip_codes(self, batch_size: int = 50) -> None:
+    async def scrape_zip_codes(self, batch_size: int = 50, claim_size: int = 100) -> None:
         """
         Main scraping loop for processing all zip codes.
         
+        A producer claims zip codes from MongoDB in batches into a bounded queue
+        which is drained by a pool of ``concurrency`` worker coroutines.
+        
         Args:
-            batch_size: Number of requests between progress saves
-        """
-        total_zips = self.zipcodes_collection.count_documents({})
-        logger.info(f"Starting scrape for {total_zips} zip codes")
-
-        i = 1
-        zip_code_record = self._get_item_from_mongo()
-
-        while zip_code_record and zip_code_record.get("zip_code"):
-            zip_code = zip_code_record["zip_code"]
-            logger.info(f"Processing zip code {i}/{total_zips}: {zip_code}")
-
-            result = self._make_request(zip_code_record["_id"], zip_code)
-
-            if result:
-                self.results.append(result)
-
-                # Save progress periodically
-                if i % batch_size == 0:
-                    self._save_progress()
-                    success_rate = (self.successful_requests / i) * 100
-                    logger.info(
-                        f"Progress: {i}/{total_zips} - "
-                        f"Success: {self.successful_requests}, "
-                        f"Failed: {self.failed_requests}, "
-                        f"Success Rate: {success_rate:.1f}%"
-                    )
-
-                    # Extended break every 200 requests
-                    if i % 200 == 0:
-                        break_time = random.uniform(120, 300)
-                        logger.info(f"Taking a {break_time:.0f} second break...")
-                        time.sleep(break_time)
-
-            # Progress update
-            if i % 10 == 0:
-                logger.info(f"Progress: {i}/{total_zips}")
-                
-            i += 1
-            zip_code_record = self._get_item_from_mongo()
-
-        # Final statistics and save
-        success_rate = (self.successful_requests / total_zips) * 100 if total_zips > 0 else 0
+            batch_size: Number of requests between flushes of buffered results
+            claim_size: Number of zip codes claimed from MongoDB at once
+        """
+        await self._ensure_indexes()
+        remaining = await self.zipcodes_collection.count_documents({"tag": False})
+        logger.info(f"Starting scrape; {remaining} zip codes remaining across all processes")
+
+        # The next batch is claimed as soon as the previous one is fully
+        # enqueued, so at most two claims are held in memory at once
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * claim_size)
+
+        async def producer() -> None:
+            while True:
+                records = await self._claim_batch(claim_size)
+                if not records:
+                    break
+                for zip_code_record in records:
+                    if zip_code_record.get("zip_code"):
+                        await queue.put(zip_code_record)
+            # One sentinel per worker signals the end of the work
+            for _ in range(self.concurrency):
+                await queue.put(None)
+
+        async def worker() -> None:
+            while True:
+                zip_code_record = await queue.get()
+                if zip_code_record is None:
+                    return
+
+                zip_code = zip_code_record["zip_code"]
+                self.processed_requests += 1
+                i = self.processed_requests
+                logger.info(f"Processing zip code {zip_code} ({i} in this process)")
+
+                result = await self._make_request(zip_code_record["_id"], zip_code)
+
+                if result:
+                    # Persist buffered results periodically
+                    if i % batch_size == 0:
+                        await self._flush_updates()
+                        success_rate = (self.successful_requests / i) * 100
+                        logger.info(
+                            f"Progress: {i} processed in this process - "
+                            f"Success: {self.successful_requests}, "
+                            f"Failed: {self.failed_requests}, "
+                            f"Success Rate: {success_rate:.1f}%"
+                        )
+
+                # Progress update
+                if i % 10 == 0:
+                    logger.info(f"Progress: {i} processed in this process")
+
+        self.session = self._new_session()
+        try:
+            await asyncio.gather(producer(), *[worker() for _ in range(self.concurrency)])
+        finally:
+            await self.session.close()
+            for session in self._sessions_by_proxy.values():
+                await session.close()
+            self._sessions_by_proxy.clear()
+            await self._flush_updates()
+
+        # Final statistics
+        processed = self.processed_requests
+        success_rate = (self.successful_requests / processed) * 100 if processed > 0 else 0
         logger.info(
             f"Scraping completed! Success: {self.successful_requests}, "
             f"Failed: {self.failed_requests}, Success Rate: {success_rate:.1f}%"
         )
-        self._save_progress()
 
-    def _save_progress(self) -> None:
-        """Save current results to CSV file."""
-        if not self.results:
-            return
+    def _flatten_result(self, result: Dict) -> Dict:
+        """
+        Flatten a scraped result into a CSV row.
+        
+        Args:
+            result: Stored result document
+            
+        Returns:
+            Dictionary keyed by CSV_FIELDS
+        """
+        row = dict.fromkeys(CSV_FIELDS)
+        row["zip_code"] = result["zip_code"]
+        row["total_price"] = result["total_price"]
+        row["timestamp"] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(result["timestamp"]))
+
+        # Extract nested data from the compressed raw response; results from
+        # older versions store the decoded response as a raw_response dict
+        if "raw_response_zstd" in result:
+            data = self._decode_response(self._zdctx.decompress(result["raw_response_zstd"]))
+        else:
+            data = result.get("raw_response")
+            if not isinstance(data, dict):
+                data = None
+        response_data = RESPONSE_DATA_PATH.search(data) if data else None
+        if response_data:
+            row.update(response_data)
+
+        return row
+
+    async def export_results(self) -> None:
+        """
+        Export all scraped results stored in MongoDB to a CSV file.
+        
+        Results are persisted to MongoDB as they are scraped, so the export
+        also covers earlier and interrupted runs.
+        """
+        projection = {
+            "_id": 0, "zip_code": 1, "total_price": 1, "timestamp": 1,
+            "raw_response_zstd": 1, "raw_response": 1
+        }
+        query = {"$or": [
+            {"raw_response_zstd": {"$exists": True}},
+            {"raw_response": {"$exists": True}}
+        ]}
+        cursor = self.zipcodes_collection.find(query, projection).batch_size(1000)
 
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         filename = f"storage_prices_{timestamp}.csv"
 
-        csv_data = []
-        for result in self.results:
-            csv_json = {
-                "zip_code": result["zip_code"],
-                "total_price": result["total_price"],
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(result["timestamp"])),
-                "date": None,
-                "ldate": None,
-                "email": None,
-                "name": None,
-                "phone": None,
-                "rooms": None,
-                "promocode": None,
-                "sixteens": None,
-                "twelves": None,
-                "clientIP": None,
-                "months": None,
-                "CityFrom": None,
-                "StateFrom": None,
-                "ID": None,
-            }
-
-            # Extract nested data from raw response
-            if ("raw_response" in result and isinstance(result["raw_response"], dict) and 
-                "data" in result["raw_response"]):
-                data = result["raw_response"]["data"]
-                
-                fields_to_extract = [
-                    "date", "ldate", "email", "name", "phone", "rooms", 
-                    "sixteens", "twelves", "clientIP", "CityFrom", "StateFrom", 
-                    "ID", "months", "promocode"
-                ]
-                
-                for field in fields_to_extract:
-                    if field in data:
-                        csv_json[field] = data[field]
-
-            csv_data.append(csv_json)
-
-        # Save to CSV
-        df_csv = pd.DataFrame(csv_data)
-        df_csv.to_csv(filename, index=False)
-        logger.info(f"Progress saved to {filename}")
-
-
-def main():
-    """Main execution function."""
+        rows = 0
+        with open(filename, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            async for doc in cursor:
+                writer.writerow(self._flatten_result(doc))
+                rows += 1
+
+        logger.info(f"Saved {rows} results to {filename}")
+
+
+def run_worker(worker_id: int, requests_per_second: float) -> None:
+    """
+    Run the async scraper in a worker process.
+    
+    Args:
+        worker_id: Worker process number
+        requests_per_second: This worker's share of the global request rate
+    """
+    async def scrape() -> None:
+        # Created inside the loop so the MongoDB client binds to it
+        scraper = StoragePriceScraper(requests_per_second=requests_per_second)
+        try:
+            await scraper.scrape_zip_codes()
+        finally:
+            await scraper.client.close()
+
+    try:
+        asyncio.run(scrape())
+    except Exception as e:
+        logger.error(f"Error in worker {worker_id}: {e}")
+
+
+async def main_async(processes: Optional[int] = None):
+    """
+    Main execution function.
+    
+    Args:
+        processes: Number of worker processes (defaults to the CPU count)
+    """
     scraper = StoragePriceScraper()
+    loop = asyncio.get_running_loop()
+    workers = []
 
     try:
         # Load zip codes from CSV
-        df = pd.read_csv("us_zip_codes_5000.csv")
-        zip_codes = df["zip_code"].tolist()
+        with open("us_zip_codes_5000.csv", newline="") as f:
+            zip_codes = [row["zip_code"] for row in csv.DictReader(f)]
 
         if not zip_codes:
             logger.error("No zip codes loaded!")
             return
 
         # Reset any stalled progress and populate database
-        scraper.zipcodes_collection.update_many(
+        await scraper.zipcodes_collection.update_many(
             {"tag": "progress"}, 
             {"$set": {"tag": False}}
         )
 
         # Insert new zip codes
-        for zip_code in zip_codes:
-            if not scraper.zipcodes_collection.find_one({"zip_code": zip_code}):
-                scraper.zipcodes_collection.insert_one({
-                    "zip_code": zip_code, 
-                    "tag": False
-                })
-
-        # Start scraping
-        scraper.scrape_zip_codes()
+        await scraper._normalize_zip_codes()
+        await scraper._ensure_indexes()
+        existing = {
+            doc["zip_code"]
+            async for doc in scraper.zipcodes_collection.find({}, {"_id": 0, "zip_code": 1})
+        }
+        new_docs = [
+            {"zip_code": zip_code, "tag": False}
+            for zip_code in dict.fromkeys(zip_codes)
+            if zip_code not in existing
+        ]
+        if new_docs:
+            try:
+                result = await scraper.zipcodes_collection.insert_many(new_docs, ordered=False)
+                inserted = len(result.inserted_ids)
+            except BulkWriteError as e:
+                # Duplicates rejected by the unique index are expected
+                inserted = e.details.get("nInserted", 0)
+                logger.warning(f"Skipped {len(e.details.get('writeErrors', []))} duplicate zip codes")
+            logger.info(f"Inserted {inserted} new zip codes")
+
+        # Start scraping, splitting the request rate across the workers. Workers
+        # are spawned rather than forked as this process has a running event loop.
+        processes = processes or os.cpu_count() or 1
+        logger.info(f"Starting {processes} worker processes")
+        context = multiprocessing.get_context("spawn")
+        workers.extend(
+            context.Process(target=run_worker, args=(i, REQUESTS_PER_SECOND / processes))
+            for i in range(processes)
+        )
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            await loop.run_in_executor(None, worker.join)
 
     except Exception as e:
         logger.error(f"Error in main execution: {e}")
 
+    finally:
+        # Also runs when the scrape is interrupted, so a CSV is always written.
+        # Interrupted workers are still flushing buffered results; wait for them.
+        for worker in workers:
+            if worker.pid is not None:  # Only started processes can be joined
+                await loop.run_in_executor(None, worker.join, WORKER_SHUTDOWN_TIMEOUT)
+        try:
+            await scraper.export_results()
+        except Exception as e:
+            logger.error(f"Error exporting results: {e}")
+        await scraper.client.close()
+
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main_async())